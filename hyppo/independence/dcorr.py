@@ -1,10 +1,24 @@
+from functools import partial
+
 import numpy as np
-from numba import jit
+from joblib import effective_n_jobs
+from numba import config, cuda, float64, get_num_threads, jit, prange, set_num_threads
+from scipy.spatial.distance import pdist, squareform
 
-from ..tools import check_perm_blocks_dim, chi2_approx, compute_dist
+from ..tools import check_perm_blocks_dim, chi2_approx, compute_dist, perm_test
+from ..tools.common import _PermGroups
 from ._utils import _CheckInputs
 from .base import IndependenceTest, IndependenceTestOutput
 
+# metrics where scipy's pdist is faster than sklearn's full pairwise_distances
+_PDIST_METRICS = ("euclidean", "chebyshev")
+
+# blocks of rows summed in parallel for row and column sums
+_SUM_BLOCKS = 64
+
+# threads per block (one block per permutation) for the CUDA permutation test
+_CUDA_THREADS = 128
+
 
 class Dcorr(IndependenceTest):
     r"""
@@ -102,16 +116,25 @@ class Dcorr(IndependenceTest):
         function.
     bias : bool, default: False
         Whether or not to use the biased or unbiased test statistics.
+    dtype : numpy dtype, default: ``np.float64``
+        Precision the distance matrices are stored in. ``np.float32`` halves the
+        memory needed for large `n`, while sums are still accumulated in double
+        precision. Does not affect the :math:`\mathcal{O}(n \log n)` version, or
+        the statistic with plain Euclidean distances, which stores no distance
+        matrices.
     **kwargs
         Arbitrary keyword arguments for ``compute_distance``.
     """
 
-    def __init__(self, compute_distance="euclidean", bias=False, **kwargs):
+    def __init__(
+        self, compute_distance="euclidean", bias=False, dtype=np.float64, **kwargs
+    ):
         # set is_distance to true if compute_distance is None
         self.is_distance = False
         if not compute_distance:
             self.is_distance = True
         self.bias = bias
+        self.dtype = dtype
         self.is_fast = False
         IndependenceTest.__init__(self, compute_distance=compute_distance, **kwargs)
 
@@ -136,17 +159,44 @@ class Dcorr(IndependenceTest):
         distx = x
         disty = y
 
+        # full distance matrices are never stored for scipy metrics: Euclidean
+        # distances are reduced as they are computed, others are reduced from
+        # their condensed form (the unbiased scaling needs n > 3)
+        if (
+            not (self.is_distance or self.is_fast or self.kwargs)
+            and self.compute_distance in _PDIST_METRICS
+            and x.shape[0] > 3
+        ):
+            if self.compute_distance == "euclidean":
+                covar, varx, vary = _dcov_euclidean(x, y, bias=self.bias)
+            else:
+                distx = pdist(x, metric=self.compute_distance)
+                disty = pdist(y, metric=self.compute_distance)
+                covar, varx, vary = _dcov_condensed(
+                    distx.astype(self.dtype, copy=False),
+                    disty.astype(self.dtype, copy=False),
+                    x.shape[0],
+                    bias=self.bias,
+                )
+            stat = 0 if varx <= 0 or vary <= 0 else covar / np.sqrt(varx * vary)
+            self.stat = stat
+
+            return stat
+
         if not (self.is_distance or self.is_fast):
-            distx, disty = compute_dist(
-                x, y, metric=self.compute_distance, **self.kwargs
-            )
+            distx, disty = self._compute_dist(x, y)
+        if not self.is_fast:
+            distx = distx.astype(self.dtype, copy=False)
+            disty = disty.astype(self.dtype, copy=False)
 
         stat = _dcorr(distx, disty, bias=self.bias, is_fast=self.is_fast)
         self.stat = stat
 
         return stat
 
-    def test(self, x, y, reps=1000, workers=1, auto=True, perm_blocks=None):
+    def test(
+        self, x, y, reps=1000, workers=1, auto=True, perm_blocks=None, device="cpu"
+    ):
         r"""
         Calculates the Dcorr test statistic and p-value.
 
@@ -162,17 +212,20 @@ class Dcorr(IndependenceTest):
             The number of replications used to estimate the null distribution
             when using the permutation test used to calculate the p-value.
         workers : int, default: 1
-            The number of cores to parallelize the p-value computation over.
-            Supply ``-1`` to use all cores available to the Process.
+            The number of threads the permutation null distribution is calculated
+            over. Supply ``-1`` to use all cores available to the Process. For the
+            :math:`\mathcal{O}(n \log n)` version, the number of processes
+            :meth:`hyppo.tools.perm_test` is parallelized over.
         auto : bool, default: True
             Automatically uses fast approximation when `n` and size of array
             is greater than 20. If ``True``, and sample size is greater than 20, then
             :class:`hyppo.tools.chi2_approx` will be run. Parameters ``reps`` and
             ``workers`` are
-            irrelevant in this case. Otherwise, :class:`hyppo.tools.perm_test` will be
-            run.
+            irrelevant in this case. Otherwise, a permutation test compiled with
+            ``numba`` is run on the centered distance matrices.
             If ``x`` and ``y`` have `p` equal to 1 and ``compute_distance`` set to
-            ``'euclidean'``, then and :math:`\mathcal{O}(n \log n)` version is run.
+            ``'euclidean'``, then and :math:`\mathcal{O}(n \log n)` version is run,
+            with its permutation test run by :meth:`hyppo.tools.perm_test`.
         perm_blocks : None or ndarray, default: None
             Defines blocks of exchangeable samples during the permutation test.
             If None, all samples can be permuted with one another. Requires `n`
@@ -181,6 +234,11 @@ class Dcorr(IndependenceTest):
             block, samples are exchangeable. Blocks of samples from the same
             partition are also exchangeable between one another. If a column
             value is negative, that block is fixed and cannot be exchanged.
+        device : str, default: "cpu"
+            Where the permutation test is run. Set to ``"cuda"`` to compute the
+            null distribution on a CUDA GPU (requires a CUDA-enabled ``numba``).
+            Ignored if the fast approximation or the :math:`\mathcal{O}(n \log n)`
+            version is run.
 
         Returns
         -------
@@ -220,6 +278,8 @@ class Dcorr(IndependenceTest):
         x, y = check_input()
         if perm_blocks is not None:
             check_perm_blocks_dim(perm_blocks, y)
+        if device not in ("cpu", "cuda"):
+            raise ValueError("device must be 'cpu' or 'cuda', not {}".format(device))
 
         if (
             auto
@@ -234,51 +294,132 @@ class Dcorr(IndependenceTest):
             self.stat = stat
             self.pvalue = pvalue
             self.null_dist = None
+        elif self.is_fast:
+            # variances do not change under permutation, so calculate them once
+            variances = (
+                _dvar(x, bias=self.bias, is_fast=True),
+                _dvar(y, bias=self.bias, is_fast=True),
+            )
+            stat, pvalue, null_dist = perm_test(
+                partial(_dcorr, bias=self.bias, is_fast=True, variances=variances),
+                x,
+                y,
+                reps=reps,
+                workers=workers,
+                is_distsim=False,
+                perm_blocks=perm_blocks,
+            )
+            self.stat = stat
+            self.pvalue = pvalue
+            self.null_dist = null_dist
         else:
-            if not self.is_fast:
-                x, y = compute_dist(x, y, metric=self.compute_distance, **self.kwargs)
-                self.is_distance = True
-            stat, pvalue = super(Dcorr, self).test(
+            x, y = self._compute_dist(x, y)
+            x = x.astype(self.dtype, copy=False)
+            y = y.astype(self.dtype, copy=False)
+            self.is_distance = True
+
+            # centering commutes with permuting the rows and columns of the
+            # distance matrix, so center once instead of every permutation
+            symmetric = _is_symmetric(x) and _is_symmetric(y)
+            x = _center_distmat(x, self.bias)
+            y = _center_distmat(y, self.bias)
+            stat, pvalue, null_dist = _perm_test_centered(
                 x,
                 y,
+                self.bias,
                 reps,
-                workers,
+                workers=workers,
                 perm_blocks=perm_blocks,
-                is_distsim=self.is_distance,
+                device=device,
+                symmetric=symmetric,
             )
+            self.stat = stat
+            self.pvalue = pvalue
+            self.null_dist = null_dist
 
         return IndependenceTestOutput(stat, pvalue)
 
+    def _compute_dist(self, x, y):
+        """Distance matrices, computing only the upper triangle where possible"""
+        if self.compute_distance in _PDIST_METRICS and not self.kwargs:
+            distx = squareform(pdist(x, metric=self.compute_distance))
+            disty = squareform(pdist(y, metric=self.compute_distance))
+        else:
+            distx, disty = compute_dist(
+                x, y, metric=self.compute_distance, **self.kwargs
+            )
+        return distx, disty
+
+
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
+def _row_col_sums(distx):  # pragma: no cover
+    """
+    Row and column sums of a matrix in one parallel pass, in double precision.
+    """
+    # each block of rows gets its own column sums so threads do not race
+    n = distx.shape[0]
+    nblocks = min(n, _SUM_BLOCKS)
+    rowx = np.zeros(n)
+    colx_blocks = np.zeros((nblocks, n))
+    for b in prange(nblocks):
+        for i in range(b * n // nblocks, (b + 1) * n // nblocks):
+            for j in range(n):
+                rowx[i] += distx[i, j]
+                colx_blocks[b, j] += distx[i, j]
+
+    return rowx, colx_blocks.sum(axis=0)
+
 
 @jit(nopython=True, cache=True)
+def _is_symmetric(distx):  # pragma: no cover
+    """
+    Whether a matrix exactly equals its transpose, stopping at the first mismatch.
+    Precomputed or custom distance matrices need not be symmetric.
+    """
+    n = distx.shape[0]
+    for i in range(n):
+        for j in range(i):
+            if distx[i, j] != distx[j, i]:
+                return False
+    return True
+
+
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
 def _center_distmat(distx, bias):  # pragma: no cover
     """Centers the distance matrices"""
     n = distx.shape[0]
     if bias:
-        # use sum instead of mean because of numba restrictions
-        exp_distx = (
-            np.repeat(distx.sum(axis=0) / n, n).reshape(-1, n).T
-            + np.repeat(distx.sum(axis=1) / n, n).reshape(-1, n)
-            - (distx.sum() / (n * n))
-        )
+        d1 = n
+        d2 = n * n
     else:
-        exp_distx = (
-            np.repeat((distx.sum(axis=0) / (n - 2)), n).reshape(-1, n).T
-            + np.repeat((distx.sum(axis=1) / (n - 2)), n).reshape(-1, n)
-            - distx.sum() / ((n - 1) * (n - 2))
-        )
-    cent_distx = distx - exp_distx
-    if not bias:
-        np.fill_diagonal(cent_distx, 0)
+        d1 = n - 2
+        d2 = (n - 1) * (n - 2)
+
+    # accumulate sums in double precision and keep the input dtype for storage
+    rowx, colx = _row_col_sums(distx)
+    grandx = rowx.sum() / d2
+    rowx /= d1
+    colx /= d1
+
+    # the unbiased version zeros the diagonal while the row is still in cache
+    cent_distx = np.empty_like(distx)
+    for i in prange(n):
+        for j in range(n):
+            cent_distx[i, j] = distx[i, j] - rowx[i] - colx[j] + grandx
+        if not bias:
+            cent_distx[i, i] = 0
     return cent_distx
 
 
 @jit(nopython=True, cache=True)
 def _cpu_cumsum(data):  # pragma: no cover
     """Create cumulative sum since numba doesn't sum over axes."""
-    cumsum = data.copy()
-    for i in range(1, data.shape[0]):
-        cumsum[i, :] = data[i, :] + cumsum[i - 1, :]
+    n, p = data.shape
+    cumsum = np.empty_like(data)
+    cumsum[0, :] = data[0, :]
+    for i in range(1, n):
+        for j in range(p):
+            cumsum[i, j] = data[i, j] + cumsum[i - 1, j]
     return cumsum
 
 
@@ -292,33 +433,34 @@ def _fast_1d_dcov(x, y, bias=False):  # pragma: no cover
     """
     n = x.shape[0]
 
-    # sort inputs
+    # sort inputs, reordering y by the same permutation
     x_orig = x.ravel()
-    x = np.sort(x_orig)
-    y = y[np.argsort(x_orig)]
-    x = x.reshape(-1, 1)  # for numba
+    order = np.argsort(x_orig)
+    x = x_orig[order].reshape(-1, 1)  # for numba
+    y = y[order]
 
     # cumulative sum
+    coef = np.arange(-(n - 2), n + 1, 2).astype(np.float64)
     si = _cpu_cumsum(x)
-    ax = (np.arange(-(n - 2), n + 1, 2) * x.ravel()).reshape(-1, 1) + (si[-1] - 2 * si)
+    ax = (coef * x.ravel()).reshape(-1, 1) + (si[-1] - 2 * si)
 
     v = np.hstack((x, y, x * y))
     nw = v.shape[1]
 
-    idx = np.vstack((np.arange(n), np.zeros(n))).astype(np.int64).T
-    iv1 = np.zeros((n, 1))
-    iv2 = np.zeros((n, 1))
-    iv3 = np.zeros((n, 1))
-    iv4 = np.zeros((n, 1))
+    # merge sort reads from idx_r and writes to idx_s, swapping them every pass
+    idx_r = np.arange(n)
+    idx_s = np.empty(n, dtype=np.int64)
+    ivs = np.zeros((4, n))
+    csumv = np.zeros((n + 1, nw))
 
     i = 1
-    r = 0
-    s = 1
     while i < n:
         gap = 2 * i
         k = 0
-        idx_r = idx[:, r]
-        csumv = np.vstack((np.zeros((1, nw)), _cpu_cumsum(v[idx_r, :])))
+        # cumulative sum of v in the current order, with a leading row of zeros
+        for t in range(n):
+            for c in range(nw):
+                csumv[t + 1, c] = csumv[t, c] + v[idx_r[t], c]
 
         for j in range(1, n + 1, gap):
             st1 = j - 1
@@ -331,43 +473,40 @@ def _fast_1d_dcov(x, y, bias=False):  # pragma: no cover
                 idx2 = idx_r[st2]
 
                 if y[idx1] >= y[idx2]:
-                    idx[k, s] = idx1
+                    idx_s[k] = idx1
                     st1 += 1
                 else:
-                    idx[k, s] = idx2
+                    idx_s[k] = idx2
                     st2 += 1
-                    iv1[idx2] += e1 - st1 + 1
-                    iv2[idx2] += csumv[e1 + 1, 0] - csumv[st1, 0]
-                    iv3[idx2] += csumv[e1 + 1, 1] - csumv[st1, 1]
-                    iv4[idx2] += csumv[e1 + 1, 2] - csumv[st1, 2]
+                    ivs[0, idx2] += e1 - st1 + 1
+                    ivs[1, idx2] += csumv[e1 + 1, 0] - csumv[st1, 0]
+                    ivs[2, idx2] += csumv[e1 + 1, 1] - csumv[st1, 1]
+                    ivs[3, idx2] += csumv[e1 + 1, 2] - csumv[st1, 2]
                 k += 1
 
             if st1 <= e1:
                 kf = k + e1 - st1 + 1
-                idx[k:kf, s] = idx_r[st1 : e1 + 1]
+                idx_s[k:kf] = idx_r[st1 : e1 + 1]
                 k = kf
             elif st2 <= e2:
                 kf = k + e2 - st2 + 1
-                idx[k:kf, s] = idx_r[st2 : e2 + 1]
+                idx_s[k:kf] = idx_r[st2 : e2 + 1]
                 k = kf
 
         i = gap
-        r = 1 - r
-        s = 1 - s
+        idx_r, idx_s = idx_s, idx_r
 
     covterm = np.sum(n * (x - np.mean(x)).T @ (y - np.mean(y)))
-    c1 = np.sum(iv1.T @ v[:, 2].copy())
-    c2 = np.sum(iv4)
-    c3 = np.sum(iv2.T @ y)
-    c4 = np.sum(iv3.T @ x)
+    c1 = ivs[0] @ v[:, 2].copy()
+    c2 = np.sum(ivs[3])
+    c3 = ivs[1] @ y.ravel()
+    c4 = ivs[2] @ x.ravel()
     d = 4 * ((c1 + c2) - (c3 + c4)) - 2 * covterm
 
-    y_sorted = y[idx[n::-1, r], :]
+    y_sorted = y[idx_r[::-1], :]
     si = _cpu_cumsum(y_sorted)
     by = np.zeros((n, 1))
-    by[idx[::-1, r]] = (np.arange(-(n - 2), n + 1, 2) * y_sorted.ravel()).reshape(
-        -1, 1
-    ) + (si[-1] - 2 * si)
+    by[idx_r[::-1]] = (coef * y_sorted.ravel()).reshape(-1, 1) + (si[-1] - 2 * si)
 
     if bias:
         denom = [n ** 2, n ** 3, n ** 4]
@@ -383,45 +522,211 @@ def _fast_1d_dcov(x, y, bias=False):  # pragma: no cover
     return stat
 
 
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
+def _dcov_fused(distx, disty, bias=False):  # pragma: no cover
+    """
+    Calculate the sum of the product of the centered distance matrices without
+    storing the centered distance matrices.
+    """
+    n = distx.shape[0]
+    if bias:
+        d1 = n
+        d2 = n * n
+    else:
+        d1 = n - 2
+        d2 = (n - 1) * (n - 2)
+
+    rowx, colx = _row_col_sums(distx)
+    grandx = rowx.sum() / d2
+    rowx /= d1
+    colx /= d1
+    rowy, coly = _row_col_sums(disty)
+    grandy = rowy.sum() / d2
+    rowy /= d1
+    coly /= d1
+
+    stat = 0.0
+    for i in prange(n):
+        for j in range(n):
+            if bias or i != j:
+                stat += (distx[i, j] - rowx[i] - colx[j] + grandx) * (
+                    disty[i, j] - rowy[i] - coly[j] + grandy
+                )
+
+    return stat
+
+
 @jit(nopython=True, cache=True)
+def _dcov_from_sums(prods, rowx, rowy, bias=False):  # pragma: no cover
+    """
+    Dcov of ``x`` and ``y`` and of each with itself, from the sums over pairs
+    ``i < j`` of the products of distances and the row sums of the distances.
+    """
+    n = rowx.shape[0]
+    if bias:
+        d1 = n
+        d2 = n * n
+        d3 = n * n
+    else:
+        d1 = n - 2
+        d2 = (n - 1) * (n - 2)
+        d3 = n * (n - 3)
+
+    # sum of the product of centered distance matrices, expanded in terms of
+    # the uncentered products, row sums, and grand sums
+    grandx = rowx.sum()
+    grandy = rowy.sum()
+    covar = 2 * prods[0] - 2 * (rowx * rowy).sum() / d1 + grandx * grandy / d2
+    varx = 2 * prods[1] - 2 * (rowx * rowx).sum() / d1 + grandx * grandx / d2
+    vary = 2 * prods[2] - 2 * (rowy * rowy).sum() / d1 + grandy * grandy / d2
+
+    return covar / d3, varx / d3, vary / d3
+
+
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
+def _dcov_euclidean(x, y, bias=False):  # pragma: no cover
+    """
+    Calculate the Dcov of ``x`` and ``y`` and of each with itself from Euclidean
+    distances reduced as they are computed, without storing distance matrices.
+    """
+    n = x.shape[0]
+
+    # distances are symmetric, so each pair is visited once and every block of
+    # rows keeps its own row sums; rows are dealt out cyclically to balance the
+    # lower triangle across blocks
+    nblocks = min(n, _SUM_BLOCKS)
+    rowx_blocks = np.zeros((nblocks, n))
+    rowy_blocks = np.zeros((nblocks, n))
+    prod_blocks = np.zeros((nblocks, 3))
+    for b in prange(nblocks):
+        sxy = 0.0
+        sxx = 0.0
+        syy = 0.0
+        for i in range(b, n, nblocks):
+            for j in range(i):
+                dx = 0.0
+                for k in range(x.shape[1]):
+                    dx += (x[i, k] - x[j, k]) ** 2
+                dx = np.sqrt(dx)
+                dy = 0.0
+                for k in range(y.shape[1]):
+                    dy += (y[i, k] - y[j, k]) ** 2
+                dy = np.sqrt(dy)
+
+                rowx_blocks[b, i] += dx
+                rowx_blocks[b, j] += dx
+                rowy_blocks[b, i] += dy
+                rowy_blocks[b, j] += dy
+                sxy += dx * dy
+                sxx += dx * dx
+                syy += dy * dy
+        prod_blocks[b, 0] = sxy
+        prod_blocks[b, 1] = sxx
+        prod_blocks[b, 2] = syy
+
+    return _dcov_from_sums(
+        prod_blocks.sum(axis=0),
+        rowx_blocks.sum(axis=0),
+        rowy_blocks.sum(axis=0),
+        bias,
+    )
+
+
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
+def _dcov_condensed(distx, disty, n, bias=False):  # pragma: no cover
+    """
+    Calculate the Dcov of ``x`` and ``y`` and of each with itself from condensed
+    distance matrices (the upper triangles, as returned by ``pdist``).
+    """
+    nblocks = min(n, _SUM_BLOCKS)
+    rowx_blocks = np.zeros((nblocks, n))
+    rowy_blocks = np.zeros((nblocks, n))
+    prod_blocks = np.zeros((nblocks, 3))
+    for b in prange(nblocks):
+        sxy = 0.0
+        sxx = 0.0
+        syy = 0.0
+        for i in range(b, n, nblocks):
+            # row i of the upper triangle is contiguous, starting at pair (i, i + 1)
+            start = n * i - i * (i + 1) // 2 - i - 1
+            for j in range(i + 1, n):
+                dx = distx[start + j]
+                dy = disty[start + j]
+                rowx_blocks[b, i] += dx
+                rowx_blocks[b, j] += dx
+                rowy_blocks[b, i] += dy
+                rowy_blocks[b, j] += dy
+                sxy += dx * dy
+                sxx += dx * dx
+                syy += dy * dy
+        prod_blocks[b, 0] = sxy
+        prod_blocks[b, 1] = sxx
+        prod_blocks[b, 2] = syy
+
+    return _dcov_from_sums(
+        prod_blocks.sum(axis=0),
+        rowx_blocks.sum(axis=0),
+        rowy_blocks.sum(axis=0),
+        bias,
+    )
+
+
+# callers of parallel functions are also marked parallel, numba segfaults otherwise
+# when loading them from the cache
+@jit(nopython=True, cache=True, parallel=True, fastmath=True)
 def _dcov(distx, disty, bias=False, only_dcov=True):  # pragma: no cover
     """Calculate the Dcov test statistic"""
     if only_dcov:
-        # center distance matrices
-        distx = _center_distmat(distx, bias)
-        disty = _center_distmat(disty, bias)
-
-    stat = np.sum(distx * disty)
+        # center and multiply the distance matrices in a single pass
+        stat = _dcov_fused(distx, disty, bias)
 
-    if only_dcov:
         N = distx.shape[0]
         if bias:
             stat = 1 / (N ** 2) * stat
         else:
             stat = 1 / (N * (N - 3)) * stat
+    else:
+        # accumulate directly rather than storing the elementwise product
+        n = distx.shape[0]
+        stat = 0.0
+        for i in prange(n):
+            for j in range(n):
+                stat += distx[i, j] * disty[i, j]
 
     return stat
 
 
-@jit(nopython=True, cache=True)
-def _dcorr(distx, disty, bias=False, is_fast=False):  # pragma: no cover
+def _dvar(distx, bias=False, is_fast=False):
+    """
+    Calculate the Dcov of a centered distance matrix (or 1D input) with itself.
+    """
+    if is_fast:
+        return _fast_1d_dcov(distx, distx, bias=bias)
+    return _dcov(distx, distx, bias=bias, only_dcov=False)
+
+
+def _dcorr(distx, disty, bias=False, is_fast=False, is_centered=False, variances=None):
     """
     Calculate the Dcorr test statistic.
     """
+    is_same = disty is distx
     if is_fast:
-        # calculate covariances and variances
         covar = _fast_1d_dcov(distx, disty, bias=bias)
-        varx = _fast_1d_dcov(distx, distx, bias=bias)
-        vary = _fast_1d_dcov(disty, disty, bias=bias)
     else:
         # center distance matrices
-        distx = _center_distmat(distx, bias)
-        disty = _center_distmat(disty, bias)
-
-        # calculate covariances and variances
+        if not is_centered:
+            distx = _center_distmat(distx, bias)
+            disty = distx if is_same else _center_distmat(disty, bias)
         covar = _dcov(distx, disty, bias=bias, only_dcov=False)
-        varx = _dcov(distx, distx, bias=bias, only_dcov=False)
-        vary = _dcov(disty, disty, bias=bias, only_dcov=False)
+
+    # variances are invariant to permutation, so permutation tests pass them in
+    if variances is not None:
+        varx, vary = variances
+    elif is_same:
+        varx = vary = covar
+    else:
+        varx = _dvar(distx, bias=bias, is_fast=is_fast)
+        vary = _dvar(disty, bias=bias, is_fast=is_fast)
 
     # stat is 0 with negative variances (would make denominator undefined)
     if varx <= 0 or vary <= 0:
@@ -432,3 +737,132 @@ def _dcorr(distx, disty, bias=False, is_fast=False):  # pragma: no cover
         stat = covar / np.real(np.sqrt(varx * vary))
 
     return stat
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def _perm_null_dist(
+    distx, disty, orders, bias=False, symmetric=False
+):  # pragma: no cover
+    """
+    Calculate the Dcorr null distribution from centered distance matrices, where
+    each row of ``orders`` is a permutation of the samples. Only the lower
+    triangle is visited when both are centered from ``symmetric`` matrices.
+    """
+    n = distx.shape[0]
+    reps = orders.shape[0]
+
+    # variances do not change under permutation
+    varx = _dcov(distx, distx, bias=bias, only_dcov=False)
+    vary = _dcov(disty, disty, bias=bias, only_dcov=False)
+
+    null_dist = np.zeros(reps)
+    if varx <= 0 or vary <= 0:
+        return null_dist
+
+    for r in prange(reps):
+        order = orders[r]
+        covar = 0.0
+        for i in range(n):
+            oi = order[i]
+            if symmetric:
+                row = 0.0
+                for j in range(i):
+                    row += distx[i, j] * disty[oi, order[j]]
+                covar += 2 * row + distx[i, i] * disty[oi, oi]
+            else:
+                for j in range(n):
+                    covar += distx[i, j] * disty[oi, order[j]]
+        null_dist[r] = covar
+
+    return null_dist / np.real(np.sqrt(varx * vary))
+
+
+@cuda.jit
+def _perm_null_kernel(distx, disty, orders, null_dist):  # pragma: no cover
+    """
+    Each block calculates the unnormalized Dcov of one permutation, with its
+    threads striding over the entries of the distance matrices.
+    """
+    r = cuda.blockIdx.x
+    tid = cuda.threadIdx.x
+    n = distx.shape[0]
+
+    covar = 0.0
+    for k in range(tid, n * n, _CUDA_THREADS):
+        i = k // n
+        j = k % n
+        covar += distx[i, j] * disty[orders[r, i], orders[r, j]]
+
+    # tree reduction of the partial sums in shared memory
+    partial = cuda.shared.array(_CUDA_THREADS, dtype=float64)
+    partial[tid] = covar
+    cuda.syncthreads()
+    step = _CUDA_THREADS // 2
+    while step > 0:
+        if tid < step:
+            partial[tid] += partial[tid + step]
+        cuda.syncthreads()
+        step //= 2
+
+    if tid == 0:
+        null_dist[r] = partial[0]
+
+
+def _perm_null_dist_cuda(distx, disty, orders, bias=False):
+    """
+    Calculate the Dcorr null distribution on a CUDA GPU, see `_perm_null_dist`.
+    """
+    varx = _dcov(distx, distx, bias=bias, only_dcov=False)
+    vary = _dcov(disty, disty, bias=bias, only_dcov=False)
+
+    # a kernel cannot be launched on an empty grid
+    reps = orders.shape[0]
+    if reps == 0 or varx <= 0 or vary <= 0:
+        return np.zeros(reps)
+
+    null_dist = cuda.device_array(reps)
+    _perm_null_kernel[reps, _CUDA_THREADS](
+        cuda.to_device(distx), cuda.to_device(disty), cuda.to_device(orders), null_dist
+    )
+
+    return null_dist.copy_to_host() / np.real(np.sqrt(varx * vary))
+
+
+def _perm_test_centered(
+    distx,
+    disty,
+    bias,
+    reps,
+    workers=1,
+    perm_blocks=None,
+    device="cpu",
+    symmetric=False,
+):
+    """
+    Permutation test for Dcorr on centered distance matrices, with the null
+    distribution compiled and calculated in ``workers`` threads (or on the GPU).
+    Set ``symmetric`` if both were centered from exactly symmetric matrices.
+    """
+    # draw permutations beforehand so results match the serial permutation test
+    n = distx.shape[0]
+    permuter = _PermGroups(disty, perm_blocks)
+    orders = np.array([permuter() for _ in range(reps)], dtype=int).reshape(reps, n)
+
+    # the observed statistic is the null kernel on the identity order, so that
+    # permutations tying with it sum the same terms in the same order and are
+    # counted by the p-value rather than landing a few ulps below it
+    orders = np.vstack((np.arange(n)[np.newaxis], orders))
+    if device == "cuda":
+        null_dist = _perm_null_dist_cuda(distx, disty, orders, bias)
+    else:
+        n_threads = get_num_threads()
+        set_num_threads(min(effective_n_jobs(workers), config.NUMBA_NUM_THREADS))
+        try:
+            null_dist = _perm_null_dist(distx, disty, orders, bias, symmetric)
+        finally:
+            set_num_threads(n_threads)
+    stat = null_dist[0]
+    null_dist = null_dist[1:]
+    pvalue = (1 + (null_dist >= stat).sum()) / (1 + reps)
+
+    return stat, pvalue, null_dist
@@ -3,7 +3,7 @@ import numpy as np
 from ..tools import chi2_approx, compute_kern
 from ._utils import _CheckInputs
 from .base import IndependenceTest, IndependenceTestOutput
-from .dcorr import Dcorr
+from .dcorr import _center_distmat, _dcorr, _is_symmetric, _perm_test_centered
 
 
 class Hsic(IndependenceTest):
@@ -107,12 +107,17 @@ class Hsic(IndependenceTest):
         disty = y
 
         if not self.is_kernel:
-            kernx, kerny = compute_kern(x, y, metric=self.compute_kernel, **self.kwargs)
-            distx = 1 - kernx / np.max(kernx)
-            disty = 1 - kerny / np.max(kerny)
+            distx, disty = compute_kern(x, y, metric=self.compute_kernel, **self.kwargs)
+
+            # centering cancels the shift and rescaling in the biased case, so
+            # the kernels are only converted to distances when unbiased (out of
+            # place, as precomputed kernels are the caller's own arrays)
+            if not self.bias:
+                distx = 1 - distx / np.max(distx)
+                disty = 1 - disty / np.max(disty)
 
         # Hsic and Dcorr are equivalent, cannot use dcov otherwise fast is invalid
-        stat = Dcorr(bias=self.bias, compute_distance=None).statistic(distx, disty)
+        stat = _dcorr(distx, disty, bias=self.bias)
         self.stat = stat
 
         return stat
@@ -134,15 +139,15 @@ class Hsic(IndependenceTest):
             The number of replications used to estimate the null distribution
             when using the permutation test used to calculate the p-value.
         workers : int, default: 1
-            The number of cores to parallelize the p-value computation over.
-            Supply ``-1`` to use all cores available to the Process.
+            The number of threads the permutation null distribution is calculated
+            over. Supply ``-1`` to use all cores available to the Process.
         auto : bool, default: True
             Automatically uses fast approximation when `n` and size of array
             is greater than 20. If ``True``, and sample size is greater than 20, then
             :class:`hyppo.tools.chi2_approx` will be run. Parameters ``reps`` and
             ``workers`` are
-            irrelevant in this case. Otherwise, :class:`hyppo.tools.perm_test` will be
-            run.
+            irrelevant in this case. Otherwise, a permutation test compiled with
+            ``numba`` is run on the centered kernel matrices.
 
         Returns
         -------
@@ -176,6 +181,16 @@ class Hsic(IndependenceTest):
         else:
             x, y = compute_kern(x, y, metric=self.compute_kernel, **self.kwargs)
             self.is_kernel = True
-            stat, pvalue = super(Hsic, self).test(x, y, reps, workers)
+
+            # center once, centering commutes with permuting the kernel matrix
+            symmetric = _is_symmetric(x) and _is_symmetric(y)
+            x = _center_distmat(x, self.bias)
+            y = _center_distmat(y, self.bias)
+            stat, pvalue, null_dist = _perm_test_centered(
+                x, y, self.bias, reps, workers=workers, symmetric=symmetric
+            )
+            self.stat = stat
+            self.pvalue = pvalue
+            self.null_dist = null_dist
 
         return IndependenceTestOutput(stat, pvalue)
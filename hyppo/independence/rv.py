@@ -65,10 +65,10 @@ class RV(IndependenceTest):
         varx = centx.T @ centx
         vary = centy.T @ centy
 
-        covar = np.trace(covar @ covar.T)
-        stat = np.divide(
-            covar, np.sqrt(np.trace(varx @ varx)) * np.sqrt(np.trace(vary @ vary))
-        )
+        # tr(A @ A.T) is the sum of squared entries, no matrix product needed
+        # (varx and vary are symmetric)
+        covar = np.sum(covar ** 2)
+        stat = np.divide(covar, np.sqrt(np.sum(varx ** 2)) * np.sqrt(np.sum(vary ** 2)))
         self.stat = stat
 
         return stat
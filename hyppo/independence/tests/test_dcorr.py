@@ -1,9 +1,12 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal, assert_raises, assert_warns
+from numba import cuda
+from numpy.testing import assert_almost_equal, assert_equal, assert_raises, assert_warns
+from sklearn.metrics import pairwise_distances
 
-from ...tools import linear, power
+from ...tools import linear, perm_test, power
 from .. import Dcorr
+from ..dcorr import _center_distmat, _dcorr, _dvar
 
 
 class TestDcorrStat:
@@ -20,6 +23,137 @@ class TestDcorrStat:
         assert_almost_equal(stat2, obs_stat, decimal=2)
         assert_almost_equal(pvalue1, obs_pvalue, decimal=2)
 
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_fast_oned(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(50, 1, noise=True)
+        stat1, _ = Dcorr(bias=bias).test(x, y)
+        stat2 = Dcorr(bias=bias).statistic(x, y)
+
+        assert_almost_equal(stat1, stat2)
+
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_perm_workers(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(50, 3)
+        dcorr1 = Dcorr(bias=bias)
+        np.random.seed(123456789)
+        stat1, pvalue1 = dcorr1.test(x, y, reps=1000, auto=False)
+        dcorr2 = Dcorr(bias=bias)
+        np.random.seed(123456789)
+        stat2, pvalue2 = dcorr2.test(x, y, reps=1000, workers=-1, auto=False)
+
+        assert_almost_equal(stat1, stat2)
+        assert_almost_equal(pvalue1, pvalue2)
+        assert_almost_equal(dcorr1.null_dist, dcorr2.null_dist)
+
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_perm_matches_perm_test(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(50, 3)
+        distx = pairwise_distances(x, metric="euclidean")
+        disty = pairwise_distances(y, metric="euclidean")
+        dcorr = Dcorr(bias=bias)
+        np.random.seed(123456789)
+        stat1, pvalue1 = dcorr.test(x, y, reps=1000, auto=False)
+        np.random.seed(123456789)
+        stat2, pvalue2, null_dist = perm_test(
+            Dcorr(compute_distance=None, bias=bias).statistic, distx, disty, reps=1000
+        )
+
+        assert_almost_equal(stat1, stat2)
+        assert_almost_equal(pvalue1, pvalue2)
+        assert_almost_equal(dcorr.null_dist, null_dist)
+
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_perm_nonsymmetric(self, bias):
+        np.random.seed(123456789)
+        distx = np.random.rand(30, 30)
+        disty = np.random.rand(30, 30)
+        dcorr = Dcorr(compute_distance=None, bias=bias)
+        np.random.seed(123456789)
+        stat1, pvalue1 = dcorr.test(distx, disty, reps=1000, auto=False)
+        np.random.seed(123456789)
+        stat2, pvalue2, null_dist = perm_test(
+            Dcorr(compute_distance=None, bias=bias).statistic, distx, disty, reps=1000
+        )
+
+        assert_almost_equal(stat1, stat2)
+        assert_almost_equal(pvalue1, pvalue2)
+        assert_almost_equal(dcorr.null_dist, null_dist)
+
+    @pytest.mark.skipif(not cuda.is_available(), reason="requires a CUDA GPU")
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_perm_cuda(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(20, 3)
+        dcorr1 = Dcorr(bias=bias)
+        np.random.seed(123456789)
+        stat1, pvalue1 = dcorr1.test(x, y, reps=100, workers=-1, auto=False)
+        dcorr2 = Dcorr(bias=bias)
+        np.random.seed(123456789)
+        stat2, pvalue2 = dcorr2.test(x, y, reps=100, auto=False, device="cuda")
+
+        assert_almost_equal(stat1, stat2)
+        assert_almost_equal(pvalue1, pvalue2)
+        assert_almost_equal(dcorr1.null_dist, dcorr2.null_dist)
+
+    @pytest.mark.skipif(not cuda.is_available(), reason="requires a CUDA GPU")
+    def test_perm_cuda_zero_reps(self):
+        np.random.seed(123456789)
+        x, y = linear(20, 3)
+        dcorr = Dcorr()
+        dcorr.test(x, y, reps=0, auto=False, device="cuda")
+
+        assert_equal(dcorr.null_dist.shape, (0,))
+
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_float32(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(100, 3, noise=True)
+        stat1 = Dcorr(compute_distance="cityblock", bias=bias).statistic(x, y)
+        stat2 = Dcorr(
+            compute_distance="cityblock", bias=bias, dtype=np.float32
+        ).statistic(x, y)
+
+        assert_almost_equal(stat1, stat2, decimal=5)
+
+    @pytest.mark.parametrize("bias", [True, False])
+    @pytest.mark.parametrize("metric", ["euclidean", "chebyshev"])
+    def test_stat_unstored(self, bias, metric):
+        np.random.seed(123456789)
+        x, y = linear(100, 3, noise=True)
+        stat1 = Dcorr(compute_distance=metric, bias=bias).statistic(x, y)
+        distx = pairwise_distances(x, metric=metric)
+        disty = pairwise_distances(y, metric=metric)
+        stat2 = Dcorr(compute_distance=None, bias=bias).statistic(distx, disty)
+
+        assert_almost_equal(stat1, stat2)
+
+    @pytest.mark.parametrize("metric", ["euclidean", "chebyshev"])
+    def test_pdist(self, metric):
+        np.random.seed(123456789)
+        x, y = linear(100, 3, noise=True)
+        distx, disty = Dcorr(compute_distance=metric)._compute_dist(x, y)
+
+        assert_almost_equal(distx, pairwise_distances(x, metric=metric))
+        assert_almost_equal(disty, pairwise_distances(y, metric=metric))
+
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_dcorr_options(self, bias):
+        np.random.seed(123456789)
+        x, y = linear(100, 3, noise=True)
+        distx = pairwise_distances(x, metric="euclidean")
+        disty = pairwise_distances(y, metric="euclidean")
+        stat = _dcorr(distx, disty, bias=bias)
+        centx = _center_distmat(distx, bias)
+        centy = _center_distmat(disty, bias)
+        variances = (_dvar(centx, bias=bias), _dvar(centy, bias=bias))
+
+        assert_almost_equal(_dcorr(centx, centy, bias=bias, is_centered=True), stat)
+        assert_almost_equal(_dcorr(distx, disty, bias=bias, variances=variances), stat)
+        assert_almost_equal(_dcorr(distx, distx, bias=bias), 1.0)
+
 
 class TestDcorrTypeIError:
     def test_oned(self):
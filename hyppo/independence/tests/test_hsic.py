@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from numpy.testing import assert_almost_equal
+from numpy.testing import assert_almost_equal, assert_array_equal
 from sklearn.metrics.pairwise import pairwise_kernels
 
 from ...tools import linear, power
@@ -28,6 +28,19 @@ class TestHsicStat:
         assert_almost_equal(stat, 1.0, decimal=2)
         assert_almost_equal(pvalue, 1 / 1000, decimal=2)
 
+    def test_precomputed_unchanged(self):
+        np.random.seed(123456789)
+        x, y = linear(100, 3, noise=True)
+        kernx = pairwise_kernels(x, x, metric="rbf")
+        kerny = pairwise_kernels(y, y, metric="rbf")
+        kernx_orig = kernx.copy()
+        hsic = Hsic(compute_kernel="precomputed")
+        stat1 = hsic.statistic(kernx, kerny)
+        stat2 = hsic.statistic(kernx, kerny)
+
+        assert_almost_equal(stat1, stat2)
+        assert_array_equal(kernx, kernx_orig)
+
 
 class TestHsicTypeIError:
     def test_oned(self):
@@ -1,9 +1,12 @@
 import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal, assert_raises
+from sklearn.metrics import pairwise_distances
 
-from ...tools import power, rot_ksamp
+from ...independence import Dcorr
+from ...tools import perm_test, power, rot_ksamp
 from .. import KSample
+from .._utils import k_sample_transform
 
 
 class TestKSample:
@@ -33,6 +36,25 @@ class TestKSample:
 
         assert_almost_equal(stat, 0.0317, decimal=1)
 
+    @pytest.mark.parametrize("bias", [True, False])
+    def test_perm_ties(self, bias):
+        # with two small groups many permutations tie with the observed statistic
+        np.random.seed(0)
+        x = np.random.rand(5, 2)
+        y = np.random.rand(5, 2)
+        np.random.seed(123456789)
+        _, pvalue1 = KSample("Dcorr", bias=bias).test(x, y, reps=1000, auto=False)
+        u, v = k_sample_transform([x, y])
+        np.random.seed(123456789)
+        _, pvalue2, _ = perm_test(
+            Dcorr(compute_distance=None, bias=bias).statistic,
+            pairwise_distances(u),
+            pairwise_distances(v),
+            reps=1000,
+        )
+
+        assert_almost_equal(pvalue1, pvalue2)
+
 
 class TestKSampleErrorWarn:
     """Tests errors and warnings derived from MGC."""
@@ -1,7 +1,7 @@
 import warnings
 
 import numpy as np
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from scipy.stats.distributions import chi2
 from scipy.stats.stats import _contains_nan
 from sklearn.metrics import pairwise_distances
@@ -301,6 +301,7 @@ class _PermTree(object):
         self._add_levels(self.root, perm_blocks, np.arange(perm_blocks.shape[0]))
         indices = self.root.get_leaf_indices()
         self._index_order = np.argsort(indices)
+        self._add_shuffles(self.root)
 
     def _add_levels(self, root: _PermNode, perm_blocks, indices):
         # Add new child node for each unique label, then recurse or end
@@ -316,23 +317,36 @@ class _PermTree(object):
                 root.add_child(child_node)
                 self._add_levels(child_node, perm_blocks[idxs, 1:], indices[idxs])
 
+    def _add_shuffles(self, node):
+        # exchangeable children are the same for every draw, so find them once
+        # (only negative integer labels are fixed)
+        children = node.get_children()
+        node.shuffle_children = np.array(
+            [
+                i
+                for i, child in enumerate(children)
+                if isinstance(child.label, str) or child.label >= 0
+            ],
+            dtype=int,
+        )
+        if len(children[0].get_children()) == 0:
+            node.leaf_indices = np.array([child.index for child in children])
+        else:
+            node.leaf_indices = None
+            for child in children:
+                self._add_shuffles(child)
+
     def _permute_level(self, node):
-        if len(node.get_children()) == 0:
-            return [node.index]
+        if node.leaf_indices is not None:
+            indices = node.leaf_indices.copy()
         else:
-            indices, labels = zip(
-                *[
-                    (self._permute_level(child), child.label)
-                    for child in node.get_children()
-                ]
+            indices = np.asarray(
+                [self._permute_level(child) for child in node.get_children()]
             )
-            shuffle_children = [i for i, label in enumerate(labels) if label >= 0]
-            indices = np.asarray(indices)
-            if len(shuffle_children) > 1:
-                indices[shuffle_children] = indices[
-                    np.random.permutation(shuffle_children)
-                ]
-            return np.concatenate(indices)
+        shuffle_children = node.shuffle_children
+        if len(shuffle_children) > 1:
+            indices[shuffle_children] = indices[np.random.permutation(shuffle_children)]
+        return indices.ravel()
 
     def permute_indices(self):
         return self._permute_level(self.root)[self._index_order]
@@ -362,21 +376,18 @@ class _PermGroups(object):
 
 
 # p-value computation
-def _perm_stat(calc_stat, x, y, is_distsim=True, permuter=None):
-    """Permute the test statistic"""
-    if not permuter:
-        order = np.random.permutation(y.shape[0])
-    else:
-        order = permuter()
-
-    if is_distsim:
-        permy = y[order][:, order]
-    else:
-        permy = y[order]
+def _perm_stat(calc_stat, x, y, orders, is_distsim=True):
+    """Permute the test statistic for each of a batch of permutations"""
+    perm_stats = []
+    for order in orders:
+        if is_distsim:
+            permy = y[order][:, order]
+        else:
+            permy = y[order]
 
-    perm_stat = calc_stat(x, permy)
+        perm_stats.append(calc_stat(x, permy))
 
-    return perm_stat
+    return perm_stats
 
 
 def perm_test(calc_stat, x, y, reps=1000, workers=1, is_distsim=True, perm_blocks=None):
@@ -429,13 +440,16 @@ def perm_test(calc_stat, x, y, reps=1000, workers=1, is_distsim=True, perm_block
     # calculate observed test statistic
     stat = calc_stat(x, y)
 
-    # calculate null distribution
+    # calculate null distribution, drawing the permutations beforehand so results
+    # do not depend on the number of workers, each of which gets one batch of them
     permuter = _PermGroups(y, perm_blocks)
-    null_dist = np.array(
+    orders = np.array([permuter() for _ in range(reps)], dtype=int)
+    n_batches = max(1, min(reps, effective_n_jobs(workers)))
+    null_dist = np.concatenate(
         Parallel(n_jobs=workers)(
             [
-                delayed(_perm_stat)(calc_stat, x, y, is_distsim, permuter)
-                for _ in range(reps)
+                delayed(_perm_stat)(calc_stat, x, y, batch, is_distsim)
+                for batch in np.array_split(orders, n_batches)
             ]
         )
     )
@@ -1,62 +1,75 @@
+from functools import lru_cache
+
 import numpy as np
 
 from .indep_sim import SIMULATIONS
 
 
+# simulations whose rotated copy has the same shape as the original
+_SAME_SHAPE = [
+    "joint_normal",
+    "logarithmic",
+    "sin_four_pi",
+    "sin_sixteen_pi",
+    "two_parabolas",
+    "square",
+    "diamond",
+    "circle",
+    "ellipse",
+    "multiplicative_noise",
+    "multimodal_independence",
+]
+
+# simulations that are rotated by a fixed angle when increasing dimension
+_FIXED_DIM_ROTATE = [
+    "exponential",
+    "cubic",
+    "spiral",
+    "uncorrelated_bernoulli",
+    "fourth_root",
+    "circle",
+]
+
+
+@lru_cache(maxsize=64)
+def _rot_mat(rot_shape, degree, axes):
+    """
+    Rotation by ``degree`` in the plane of ``axes``, cached as a read-only array
+    since the same rotations are requested over and over in power sweeps.
+    """
+    angle = np.radians(degree)
+    rot_mat = np.identity(rot_shape)
+    rot_mat[np.ix_(axes, axes)] = np.array(
+        [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    )
+    rot_mat.setflags(write=False)
+    return rot_mat
+
+
 def _2samp_rotate(sim, x, y, p, degree=90, pow_type="samp"):
     """Generate an independence simulation, rotate it to produce another."""
-    angle = np.radians(degree)
     data = np.hstack([x, y])
-    same_shape = [
-        "joint_normal",
-        "logarithmic",
-        "sin_four_pi",
-        "sin_sixteen_pi",
-        "two_parabolas",
-        "square",
-        "diamond",
-        "circle",
-        "ellipse",
-        "multiplicative_noise",
-        "multimodal_independence",
-    ]
-    if sim in same_shape:
+    if sim in _SAME_SHAPE:
         rot_shape = 2 * p
     else:
         rot_shape = p + 1
-    rot_mat = np.identity(rot_shape)
     if pow_type == "dim":
-        if sim not in [
-            "exponential",
-            "cubic",
-            "spiral",
-            "uncorrelated_bernoulli",
-            "fourth_root",
-            "circle",
-        ]:
-            for i in range(rot_shape):
-                mat = np.random.normal(size=(rot_shape, 1))
-                mat = mat / np.sqrt(np.sum(mat ** 2))
-                if i == 0:
-                    rot = mat
-                else:
-                    rot = np.hstack([rot, mat])
-                rot_mat, _ = np.linalg.qr(rot)
-                if (p % 2) == 1:
-                    rot_mat[0] *= -1
+        if sim not in _FIXED_DIM_ROTATE:
+            # columns drawn one after another, as separate normal vectors
+            rot = np.random.normal(size=(rot_shape, rot_shape)).T
+            rot = rot / np.sqrt(np.sum(rot ** 2, axis=0))
+            rot_mat, _ = np.linalg.qr(rot)
+            if (p % 2) == 1:
+                rot_mat[0] *= -1
         else:
-            rot_mat[np.ix_((0, -1), (0, -1))] = np.array(
-                [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
-            )
+            rot_mat = _rot_mat(rot_shape, degree, (0, rot_shape - 1))
     elif pow_type == "samp":
-        rot_mat[np.ix_((0, 1), (0, 1))] = np.array(
-            [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
-        )
+        rot_mat = _rot_mat(rot_shape, degree, (0, 1))
     else:
         raise ValueError("pow_type not a valid flag ('dim', 'samp')")
-    rot_data = (rot_mat @ data.T).T
+    rot_data = data @ rot_mat.T
 
-    if sim in same_shape:
+    if sim in _SAME_SHAPE:
         x_rot, y_rot = np.hsplit(rot_data, 2)
     else:
         x_rot, y_rot = np.hsplit(rot_data, [-p])
@@ -64,7 +77,9 @@ def _2samp_rotate(sim, x, y, p, degree=90, pow_type="samp"):
     return x_rot, y_rot
 
 
-def rot_ksamp(sim, n, p, k=2, noise=True, degree=90, pow_type="samp", **kwargs):
+def rot_ksamp(
+    sim, n, p, k=2, noise=True, degree=90, pow_type="samp", dtype=np.float64, **kwargs
+):
     r"""
     Rotates input simulations to produce a `k`-sample simulation.
 
@@ -86,6 +101,8 @@ def rot_ksamp(sim, n, p, k=2, noise=True, degree=90, pow_type="samp", **kwargs):
         The list must be the same size as ``k - 1``.
     pow_type : "samp", "dim", default: "samp"
         Simulation type, (increasing sample size or dimension).
+    dtype : numpy dtype, default: ``np.float64``
+        Data type of the returned data matrices.
     **kwargs
         Additional keyword arguments for the independence simulation.
 
@@ -136,7 +153,7 @@ def rot_ksamp(sim, n, p, k=2, noise=True, degree=90, pow_type="samp", **kwargs):
                 for deg in degree
             ]
 
-    return sims
+    return [data.astype(dtype, copy=False) for data in sims]
 
 
 def gaussian_3samp(n, epsilon=1, weight=0, case=1):
@@ -40,6 +40,13 @@ class TestKSampleSimShape:
             [assert_equal(sim.shape[1], p + 1) for sim in sims1]
             [assert_equal(sim.shape[1], p + 1) for sim in sims2]
 
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64])
+    def test_dtype(self, dtype):
+        np.random.seed(123456789)
+        sims = rot_ksamp("linear", 100, 1, k=3, degree=[60, -60], dtype=dtype)
+
+        [assert_equal(sim.dtype, dtype) for sim in sims]
+
 
 class TestGaussianSimShape:
     @pytest.mark.parametrize("n", [100, 1000])
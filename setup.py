@@ -15,7 +15,7 @@ MINIMUM_PYTHON_VERSION = 3, 6  # Minimum of Python 3.6
 REQUIRED_PACKAGES = [
     "numpy>=1.17",
     "scipy>=1.4.0",
-    "numba>=0.46",
+    "numba>=0.49",
     "scikit-learn>=0.19.1",
 ]
 
@@ -107,26 +107,46 @@ sims = rot_ksamp("linear", n=100, p=1, k=3, degree=[60, -60], noise=True)
 # the simulation by 60 degrees, generating the second and, in this case, the third
 # sample. It returns realizations as :class:`numpy.ndarray`.
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# make plots look pretty
-sns.set(color_codes=True, style="white", context="talk", font_scale=1)
-
-# look at the simulation
-plt.figure(figsize=(5, 5))
-for sim in sims:
-    plt.scatter(sim[:, 0], sim[:, 1])
-plt.xticks([])
-plt.yticks([])
-sns.despine(left=True, bottom=True, right=True)
-plt.show()
+import os
+
+# set HYPPO_TUTORIAL_PLOT=0 to skip plotting, e.g. when timing the test below
+if os.environ.get("HYPPO_TUTORIAL_PLOT", "1") == "1":
+    import matplotlib.pyplot as plt
+    import numpy as np
+    import seaborn as sns
+
+    # make plots look pretty
+    sns.set(color_codes=True, style="white", context="talk", font_scale=1)
+
+    # look at the simulation (all groups in one scatter, colored by group)
+    sims_all = np.concatenate(sims)
+    colors = np.repeat(
+        sns.color_palette(n_colors=len(sims)), [sim.shape[0] for sim in sims], axis=0
+    )
+    fig, ax = plt.subplots(figsize=(5, 5))
+    ax.scatter(sims_all[:, 0], sims_all[:, 1], c=colors)
+    ax.set_xticks([])
+    ax.set_yticks([])
+    sns.despine(ax=ax, left=True, bottom=True, right=True)
+    plt.show()
 
 # run k-sample test on the provided simulations. Note that *sims just unpacks the list
 # we got containing our simulated data
 stat, pvalue = KSample(indep_test="Dcorr").test(*sims)
 print(stat, pvalue)
 
+########################################################################################
+# For two groups of 1D samples, ``indep_test="Dcorr"`` with the default
+# ``compute_distkern="euclidean"`` and ``auto=True`` runs the
+# :math:`\mathcal{O}(n \log n)` version of Dcorr, which never builds the
+# :math:`n \times n` distance matrices. Here there are three groups of 2D samples, so
+# the :math:`\mathcal{O}(n^2)` version is used, though with Euclidean distances it
+# still computes them on the fly rather than storing them. The permutation test
+# (``auto=False``) does store the distance matrices; pass ``dtype=np.float32`` to
+# :class:`hyppo.ksample.KSample` to store them in single precision, which halves their
+# memory. :func:`hyppo.tools.rot_ksamp` takes the same ``dtype`` argument, though
+# inputs are converted to double precision before the distances are computed.
+
 ########################################################################################
 # This was a general use case for the test, but there are a number of intricacies that
 # depend on the type of independence test chosen. Those same parameters can be modified